@@ -4,6 +4,8 @@ News Search Engine - Main Application
 Interactive CLI for searching and analyzing news articles.
 """
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from src.news_api import NewsAPIClient
 from src.csv_handler import CSVHandler
 from src.summarizer import Summarizer
@@ -20,9 +22,14 @@ class NewsSearchEngine:
             self.news_client = NewsAPIClient()
             self.csv_handler = CSVHandler()
             self.summarizer = Summarizer()
+            # One extractor per language, reused across searches
+            self.entity_extractors = {}
             print("\n" + "=" * 70)
             print(f"         {t('app.welcome')}")
             print("=" * 70)
+            
+            # Load a locally cached summarization model while the user is still choosing options
+            threading.Thread(target=self.summarizer.warm_up, daemon=True).start()
         except ValueError as e:
             print(f"\n{t('errors.initialization', error=str(e))}")
             sys.exit(1)
@@ -84,19 +91,29 @@ class NewsSearchEngine:
         top_15 = articles[:15]
         self._display_top_articles(top_15)
         
-        # Generate and display summary
+        # Summarization and NER inference are independent and spend most of their time
+        # in C extensions that release the GIL, so run them side by side
+        entity_extractor = self._get_entity_extractor(language)
+        # Load the models first, one after the other, so their loading messages and
+        # download progress don't interleave; both are no-ops once loaded
+        entity_extractor._load_model()
+        self.summarizer.prepare(top_15)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            summary_future = executor.submit(self.summarizer.summarize_headlines, top_15)
+            entities_future = executor.submit(entity_extractor.extract_entities, top_15)
+            summary = summary_future.result()
+            entities = entities_future.result()
+        
+        # Display summary
         print("\n" + "=" * 70)
         print(t('display.summary'))
         print("=" * 70)
-        summary = self.summarizer.summarize_headlines(top_15)
         print(summary)
         
-        # Extract and display named entities
+        # Display named entities
         print("\n" + "=" * 70)
         print(t('display.entities'))
         print("=" * 70)
-        entity_extractor = EntityExtractor(language=language)
-        entities = entity_extractor.extract_entities(top_15)
         entities_output = entity_extractor.format_entities_output(entities)
         print(entities_output)
         
@@ -106,6 +123,20 @@ class NewsSearchEngine:
             print(t('display.saved', count=len(articles), file=csv_file))
             print("=" * 70)
     
+    def _get_entity_extractor(self, language: str) -> EntityExtractor:
+        """
+        Get the cached entity extractor for a language, creating it on first use.
+        
+        Args:
+            language: Language code ('en' or 'de')
+            
+        Returns:
+            EntityExtractor for the language
+        """
+        if language not in self.entity_extractors:
+            self.entity_extractors[language] = EntityExtractor(language=language)
+        return self.entity_extractors[language]
+    
     def _display_top_articles(self, articles: list):
         """
         Display the top articles in a formatted way.
@@ -113,9 +144,10 @@ class NewsSearchEngine:
         Args:
             articles: List of article dictionaries
         """
-        print("\n" + "=" * 70)
-        print(t('display.top_articles'))
-        print("=" * 70 + "\n")
+        # Resolve labels once and emit the whole block in a single write
+        source_label = t('display.source')
+        published_label = t('display.published')
+        lines = ["\n" + "=" * 70 + "\n", t('display.top_articles') + "\n", "=" * 70 + "\n\n"]
         
         for i, article in enumerate(articles, 1):
             title = article.get('title', 'N/A')
@@ -127,11 +159,15 @@ class NewsSearchEngine:
             if published != 'N/A':
                 published = self.news_client.format_published_date(published)
             
-            print(f"{i}. {title}")
-            print(f"   {t('display.source')}: {source}")
-            print(f"   {t('display.published')}: {published}")
-            print(f"   URL: {url}")
-            print()
+            lines.append(
+                f"{i}. {title}\n"
+                f"   {source_label}: {source}\n"
+                f"   {published_label}: {published}\n"
+                f"   URL: {url}\n"
+                "\n"
+            )
+        
+        sys.stdout.write("".join(lines))
     
     def run(self):
         """Run the main application loop."""
@@ -148,6 +184,10 @@ class NewsSearchEngine:
                 #set language in i18n module
                 set_language(language)
                 
+                # Load the NER model for this language while the user types a query
+                entity_extractor = self._get_entity_extractor(language)
+                threading.Thread(target=entity_extractor.warm_up, daemon=True).start()
+                
                 # Get search query
                 print("\n" + "=" * 70)
                 query = input(f"\n{t('search.prompt')}").strip()
@@ -1,13 +1,27 @@
 """
 CSV handler module.
-Handles writing news articles to CSV files using pandas.
+Handles writing news articles to CSV files.
 """
-import pandas as pd
+import csv
+import re
 from datetime import datetime
 from typing import List, Dict
 import os
 from src.i18n import t
 
+# Matches every character that str.isalnum() rejects (underscore maps to itself)
+_QUERY_SANITIZE = re.compile(r'\W')
+
+# CSV column header -> article dictionary key, in output order
+_COLUMNS = {
+    'Title': 'title',
+    'URL': 'url',
+    'Published Date': 'published_at',
+    'Source': 'source',
+    'Author': 'author',
+    'Description': 'description'
+}
+
 
 class CSVHandler:
     """Handles CSV file operations for news articles."""
@@ -15,7 +29,7 @@ class CSVHandler:
     @staticmethod
     def save_articles_to_csv(articles: List[Dict], query: str, language: str) -> str:
         """
-        Save articles to a CSV file using pandas.
+        Save articles to a CSV file.
         
         Args:
             articles: List of article dictionaries
@@ -37,22 +51,19 @@ class CSVHandler:
         
         # Create filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        safe_query = "".join(c if c.isalnum() else "_" for c in query)[:30]
+        safe_query = _QUERY_SANITIZE.sub("_", query)[:30]
         filename = os.path.join(output_dir, f"news_{safe_query}_{language}_{timestamp}.csv")
         
         try:
-            # Create DataFrame from articles
-            df = pd.DataFrame([{
-                'Title': article.get('title', 'N/A'),
-                'URL': article.get('url', 'N/A'),
-                'Published Date': article.get('published_at', 'N/A'),
-                'Source': article.get('source', 'N/A'),
-                'Author': article.get('author', 'N/A'),
-                'Description': article.get('description', 'N/A')
-            } for article in articles])
-            
-            # Save to CSV
-            df.to_csv(filename, index=False, encoding='utf-8')
+            # Stream rows straight to disk; a search yields at most a few hundred
+            # articles, well below the size where a DataFrame writer would pay off
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(_COLUMNS))
+                writer.writeheader()
+                writer.writerows(
+                    {column: article.get(key, 'N/A') for column, key in _COLUMNS.items()}
+                    for article in articles
+                )
             
             print(f"\n{t('csv.saved', filename=filename)}")
             return filename
@@ -64,7 +75,7 @@ class CSVHandler:
     @staticmethod
     def validate_csv_file(filename: str) -> bool:
         """
-        Validate that a CSV file exists and is readable using pandas.
+        Validate that a CSV file exists and has a readable header row.
         
         Args:
             filename: Path to the CSV file
@@ -76,7 +87,8 @@ class CSVHandler:
             return False
         
         try:
-            pd.read_csv(filename, nrows=1)
+            with open(filename, newline='', encoding='utf-8') as f:
+                next(csv.reader(f))
             return True
         except:
             return False
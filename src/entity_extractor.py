@@ -2,11 +2,42 @@
 Entity extractor module.
 Handles Named Entity Recognition (NER) on news article headlines using spaCy.
 """
-from typing import List, Dict, Tuple
-from collections import Counter
-import spacy
+from typing import List, Dict, Iterator, Sequence, Tuple
+from collections import Counter, OrderedDict
+from functools import lru_cache
+import threading
 from src.i18n import t
 
+# Punctuation trimmed from word edges and common words ignored by the fallback heuristic
+_PUNCTUATION = '.,!?;:"\'-'
+_STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'from'})
+
+# Number of headlines whose spaCy entities are remembered per extractor
+_TITLE_CACHE_SIZE = 1024
+
+# Headlines per nlp.pipe batch; a full 100-article search needs only two batches
+_PIPE_BATCH_SIZE = 64
+
+
+@lru_cache(maxsize=4)
+def _load_spacy_model(model_name: str):
+    """
+    Load a spaCy pipeline once per process so extractors can share it.
+    
+    Args:
+        model_name: Name of the installed spaCy model package
+        
+    Returns:
+        Loaded spaCy Language object
+    """
+    # Imported lazily so startup doesn't pay for spaCy unless NER runs
+    import spacy
+    # Only the NER component is needed; skipping the rest roughly halves per-doc cost
+    return spacy.load(
+        model_name,
+        disable=['parser', 'tagger', 'morphologizer', 'lemmatizer', 'attribute_ruler']
+    )
+
 
 class EntityExtractor:
     """Extracts and analyzes named entities from news article headlines."""
@@ -20,84 +51,155 @@ class EntityExtractor:
         """
         self.language = language
         self.nlp = None
+        # Set once a missing model has been reported, so the warning isn't repeated
+        self._model_missing = False
+        # Serializes loading between a background warm-up and the first search
+        self._model_lock = threading.Lock()
+        # LRU of headline -> extracted (text, label) pairs; headlines recur across searches
+        self._title_entities = OrderedDict()
     
-    def _load_model(self):
-        """Load the appropriate spaCy model based on language."""
-        if self.nlp is not None:
-            return
-        
-        # Map language codes to spaCy models
-        model_map = {
-            'en': 'en_core_web_sm',
-            'de': 'de_core_news_sm'
-        }
-        
-        # Get model name for language, fallback to English if language not supported
-        model_name = model_map.get(self.language, 'en_core_web_sm')
-        
-        print(t('ner.loading', model=model_name))
-        try:
-            self.nlp = spacy.load(model_name)
-            print(t('ner.loaded'))
-        except OSError:
-            print(f"\n{t('ner.not_found', model=model_name)}")
-            print(t('ner.download_instruction', model=model_name))
-            print(f"{t('ner.fallback')}\n")
-            self.nlp = None
+    def warm_up(self):
+        """Load the spaCy model ahead of time without printing progress."""
+        self._load_model(verbose=False)
     
-    def extract_entities(self, articles: List[Dict]) -> List[Tuple[str, str, int]]:
+    def _load_model(self, verbose: bool = True):
+        """
+        Load the appropriate spaCy model based on language.
+        
+        Args:
+            verbose: Whether to print loading progress and errors
+        """
+        with self._model_lock:
+            if self.nlp is not None or self._model_missing:
+                return
+            
+            # Map language codes to spaCy models
+            model_map = {
+                'en': 'en_core_web_sm',
+                'de': 'de_core_news_sm'
+            }
+            
+            # Get model name for language, fallback to English if language not supported
+            model_name = model_map.get(self.language, 'en_core_web_sm')
+            
+            if verbose:
+                print(t('ner.loading', model=model_name))
+            try:
+                self.nlp = _load_spacy_model(model_name)
+                if verbose:
+                    print(t('ner.loaded'))
+            except OSError:
+                if verbose:
+                    print(f"\n{t('ner.not_found', model=model_name)}")
+                    print(t('ner.download_instruction', model=model_name))
+                    print(f"{t('ner.fallback')}\n")
+                    self._model_missing = True
+                self.nlp = None
+    
+    def extract_entities(self, articles: List[Dict], top_k: int = 50) -> List[Tuple[str, str, int]]:
         """
         Extract named entities from article headlines and sort by frequency.
         
         Args:
             articles: List of article dictionaries containing 'title' field
+            top_k: Maximum number of most frequent entities to return
+            
+        Returns:
+            List of tuples (entity_text, entity_type, frequency) sorted by frequency
+        """
+        return self.extract_entities_from_titles(
+            [article.get('title', '') for article in articles], top_k
+        )
+    
+    def extract_entities_from_titles(self, titles: Sequence[str], top_k: int = 50) -> List[Tuple[str, str, int]]:
+        """
+        Extract named entities from headline strings and sort by frequency.
+        
+        Args:
+            titles: Sequence of headline strings; empty and 'N/A' titles are skipped
+            top_k: Maximum number of most frequent entities to return
             
         Returns:
             List of tuples (entity_text, entity_type, frequency) sorted by frequency
         """
-        if not articles:
+        titles = [title for title in titles if title and title != 'N/A']
+        if not titles:
             return []
         
         self._load_model()
         
-        # Collect all entities
-        all_entities = []
-        
+        # Count entity frequencies directly from generators, without an intermediate list
         if self.nlp:
-            for article in articles:
-                title = article.get('title', '')
-                if title and title != 'N/A':
-                    doc = self.nlp(title)
-                    for ent in doc.ents:
-                        # Filter out very short entities (likely noise)
-                        if len(ent.text.strip()) > 1:
-                            all_entities.append((ent.text.strip(), ent.label_))
+            entities_by_title = self._spacy_entities(titles)
+            entity_counter = Counter(
+                entity for title in titles for entity in entities_by_title[title]
+            )
         else:
-            # Fallback: simple capitalized word extraction
-            for article in articles:
-                title = article.get('title', '')
-                if title and title != 'N/A':
-                    words = title.split()
-                    for word in words:
-                        # Simple heuristic: capitalized words might be entities
-                        clean_word = word.strip('.,!?;:"\'-')
-                        if (clean_word and 
-                            clean_word[0].isupper() and 
-                            len(clean_word) > 2 and
-                            clean_word.lower() not in ['the', 'and', 'for', 'with', 'from']):
-                            all_entities.append((clean_word, 'UNKNOWN'))
-        
-        # Count entity frequencies
-        entity_counter = Counter(all_entities)
-        
-        # Sort by frequency (descending) and format results
+            entity_counter = Counter(self._fallback_entities(titles))
+        
+        # Select the top_k by frequency (descending; heap-based, no full sort) and format results
         sorted_entities = [
             (entity, entity_type, count)
-            for (entity, entity_type), count in entity_counter.most_common()
+            for (entity, entity_type), count in entity_counter.most_common(top_k)
         ]
         
         return sorted_entities
     
+    def _spacy_entities(self, titles: List[str]) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+        """
+        Run spaCy NER on headlines, reusing results for headlines seen before.
+        
+        Args:
+            titles: List of headline strings
+            
+        Returns:
+            Dictionary mapping each distinct headline to its (text, label) entities
+        """
+        entities_by_title = {}
+        new_titles = []
+        for title in dict.fromkeys(titles):
+            if title in self._title_entities:
+                self._title_entities.move_to_end(title)
+                entities_by_title[title] = self._title_entities[title]
+            else:
+                new_titles.append(title)
+        
+        # Batch the uncached titles through spaCy instead of calling nlp() per title
+        for title, doc in zip(new_titles, self.nlp.pipe(new_titles, batch_size=_PIPE_BATCH_SIZE)):
+            # Filter out very short entities (likely noise)
+            entities = tuple(
+                (ent.text.strip(), ent.label_) for ent in doc.ents
+                if len(ent.text.strip()) > 1
+            )
+            entities_by_title[title] = entities
+            self._title_entities[title] = entities
+        
+        while len(self._title_entities) > _TITLE_CACHE_SIZE:
+            self._title_entities.popitem(last=False)
+        
+        return entities_by_title
+    
+    @staticmethod
+    def _fallback_entities(titles: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Fallback entity extraction using a capitalized-word heuristic.
+        
+        Args:
+            titles: List of headline strings
+            
+        Yields:
+            (word, 'UNKNOWN') tuples, one per candidate occurrence
+        """
+        for title in titles:
+            for word in title.split():
+                # Simple heuristic: capitalized words might be entities
+                clean_word = word.strip(_PUNCTUATION)
+                if (clean_word and 
+                    clean_word[0].isupper() and 
+                    len(clean_word) > 2 and
+                    clean_word.lower() not in _STOP_WORDS):
+                    yield clean_word, 'UNKNOWN'
+    
     def format_entities_output(self, entities: List[Tuple[str, str, int]]) -> str:
         """
         Format the entities list for display.
@@ -111,14 +213,17 @@ class EntityExtractor:
         if not entities:
             return t('ner.no_entities')
         
-        output = f"\n{t('ner.header')}\n"
-        output += "=" * 60 + "\n"
-        output += f"{t('ner.entity'):<30} {t('ner.type'):<15} {t('ner.frequency'):<10}\n"
-        output += "-" * 60 + "\n"
+        # Collect rows and join once instead of repeated string concatenation
+        rows = [
+            f"\n{t('ner.header')}",
+            "=" * 60,
+            f"{t('ner.entity'):<30} {t('ner.type'):<15} {t('ner.frequency'):<10}",
+            "-" * 60
+        ]
         
         for entity, entity_type, count in entities:
             # Truncate long entity names
             entity_display = entity[:28] + '..' if len(entity) > 30 else entity
-            output += f"{entity_display:<30} {entity_type:<15} {count:<10}\n"
+            rows.append(f"{entity_display:<30} {entity_type:<15} {count:<10}")
         
-        return output
+        return "\n".join(rows) + "\n"
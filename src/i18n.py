@@ -4,31 +4,77 @@ Handles translation of UI strings based on selected language.
 
 For larger projects, consider using Python's built-in gettext with .po files, but the JSON approach is simpler and more than sufficient for this use case.
 """
-import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Tuple
+
+# orjson parses noticeably faster; both expose loads() accepting bytes
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Number of formatted strings remembered per Translator
+_FORMATTED_CACHE_SIZE = 256
+
+
+def _flatten(d: Dict, prefix: str = '') -> Iterator[Tuple[str, object]]:
+    """Yield (dotted_key, value) pairs for every leaf of a nested dictionary."""
+    for k, v in d.items():
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{prefix}{k}.")
+        else:
+            yield f"{prefix}{k}", v
+
+
+@lru_cache(maxsize=None)
+def _load_translation_file(path: Path) -> Dict[str, object]:
+    """
+    Read and flatten one translation file, parsing each file only once per process.
+    
+    Args:
+        path: Path to a JSON translation file
+        
+    Returns:
+        Flat dictionary of dotted keys to translation values (shared; do not mutate)
+    """
+    return dict(_flatten(_json.loads(path.read_bytes())))
 
 
 class Translator:
-    """Simple translation handler for multi-language support."""
+    """
+    Simple translation handler for multi-language support.
+    
+    Formatted strings are cached per instance; call clear_cache() after modifying translations.
+    """
     
     def __init__(self):
         """Initialize translator with default language."""
         self.current_language = 'en'
         self.translations = {}
+        # LRU of (language, key, arguments) -> formatted string. A plain dictionary
+        # rather than an lru_cache-wrapped method, so there is no reference cycle.
+        self._formatted = OrderedDict()
         self._load_translations()
     
+    def clear_cache(self):
+        """Forget cached formatted strings; required after changing self.translations."""
+        self._formatted.clear()
+    
     def _load_translations(self):
-        """Load translation files for all supported languages."""
+        """Load translation files for all supported languages, flattened to dotted keys."""
         translations_dir = Path(__file__).parent.parent / 'translations'
         
         for lang_file in translations_dir.glob('*.json'):
             lang_code = lang_file.stem
             try:
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations[lang_code] = json.load(f)
+                # Copy, so changes to one Translator never leak into the shared cache
+                self.translations[lang_code] = dict(_load_translation_file(lang_file))
             except Exception as e:
                 print(f"Warning: Could not load translations for {lang_code}: {e}")
+        
+        self.clear_cache()
     
     def set_language(self, language: str):
         """
@@ -54,27 +100,64 @@ class Translator:
         Returns:
             Translated string
         """
-        # Get translation for current language, fallback to English
-        lang_dict = self.translations.get(self.current_language, self.translations.get('en', {}))
+        language = self.current_language
+        if not kwargs:
+            return self._resolve(language, key)
         
-        # Support nested keys with dot notation
-        keys = key.split('.')
-        value = lang_dict
+        try:
+            # Include value types, so e.g. 1 and True don't share a cache entry
+            cache_key = (
+                language, key,
+                frozenset((name, type(value), value) for name, value in kwargs.items())
+            )
+        except TypeError:
+            # Unhashable format arguments can't be cached; format them directly
+            return self._format(language, key, kwargs)
         
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, key)
-            else:
-                value = key
-                break
+        try:
+            self._formatted.move_to_end(cache_key)
+            return self._formatted[cache_key]
+        except KeyError:
+            pass
         
-        # Apply string formatting if kwargs provided
-        if kwargs and isinstance(value, str):
-            try:
-                value = value.format(**kwargs)
-            except KeyError:
-                pass
+        value = self._format(language, key, kwargs)
+        self._formatted[cache_key] = value
+        if len(self._formatted) > _FORMATTED_CACHE_SIZE:
+            self._formatted.popitem(last=False)
+        return value
+    
+    def _format(self, language: str, key: str, kwargs: Dict[str, object]) -> str:
+        """
+        Fill a translation template with format arguments.
         
+        Args:
+            language: Language code to look up
+            key: Flattened translation key (e.g., 'search.prompt')
+            kwargs: Format arguments for string interpolation
+            
+        Returns:
+            Formatted string, or the raw template if a placeholder is missing
+        """
+        value = self._resolve(language, key)
+        try:
+            return value.format(**kwargs)
+        except KeyError:
+            return value
+    
+    def _resolve(self, language: str, key: str) -> str:
+        """
+        Look up the raw template for a key, falling back to English, then to the key.
+        
+        Args:
+            language: Language code to look up
+            key: Flattened translation key (e.g., 'search.prompt')
+            
+        Returns:
+            Unformatted template string
+        """
+        value = self.translations.get(language, {}).get(key)
+        if not isinstance(value, str):
+            value = self.translations.get('en', {}).get(key)
         return value if isinstance(value, str) else key
 
 
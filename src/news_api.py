@@ -2,13 +2,36 @@
 News API integration module.
 Handles fetching news articles from NewsAPI.org based on user queries.
 """
+import math
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from newsapi import NewsApiClient
+from newsapi.newsapi_exception import NewsAPIException
 from dotenv import load_dotenv
 from src.i18n import t
 
+# Upper bound on concurrently fetched result pages per search
+MAX_PAGES = 5
+
+# Number of distinct searches whose results are kept in memory
+SEARCH_CACHE_SIZE = 64
+
+# NewsAPI timestamps look like 2026-01-15T10:30:00Z. Only timestamps that are certainly
+# valid match; days 29-31 (month-length dependent), years before 1000 and anything
+# unusual are left to the datetime parser, so both paths agree on every input.
+_ISO_DATETIME = re.compile(
+    r'([1-9]\d{3}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8]))'
+    r'T((?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d)'
+    r'(?:\.\d{3}|\.\d{6})?(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?'
+)
+
 
 class NewsAPIClient:
     """Client for fetching news articles from NewsAPI.org"""
@@ -23,14 +46,20 @@ class NewsAPIClient:
                 "Please set NEWSAPI_KEY in your .env file. "
                 "Get a free key from: https://newsapi.org/register"
             )
-        self.client = NewsApiClient(api_key=api_key)
+        # One pooled session so parallel page requests reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PAGES))
+        self.client = NewsApiClient(api_key=api_key, session=self.session)
+        # LRU cache of successful searches, keyed per query/options/day
+        self._search_cache = OrderedDict()
     
     def search_news(
         self, 
         query: str, 
         language: str = 'en',
         days_back: int = 30,
-        page_size: int = 100
+        page_size: int = 100,
+        max_results: int = 100
     ) -> List[Dict]:
         """
         Search for news articles matching the given query.
@@ -39,43 +68,84 @@ class NewsAPIClient:
             query: Search query/topic
             language: Language code (e.g., 'en', 'de')
             days_back: Number of days to look back
-            page_size: Maximum number of articles to retrieve (max 100 per request)
+            page_size: Maximum number of articles to retrieve per request (max 100)
+            max_results: Total number of articles wanted; pages beyond the first
+                are fetched in parallel (at most MAX_PAGES pages)
             
         Returns:
             List of article dictionaries containing title, url, publishedAt, source, etc.
+            Repeated searches on the same day are served from an in-memory cache.
         """
         # Calculate date range
         to_date = datetime.now()
         from_date = to_date - timedelta(days=days_back)
         
+        # Results within a day are effectively identical, so reuse them
+        cache_key = (
+            query.strip().lower(), language, days_back, page_size, max_results,
+            to_date.strftime('%Y-%m-%d')
+        )
+        if cache_key in self._search_cache:
+            self._search_cache.move_to_end(cache_key)
+            # Copies, so callers can't mutate the cached articles
+            return [dict(article) for article in self._search_cache[cache_key]]
+        
+        params = {
+            'q': query,
+            'language': language,
+            'from_param': from_date.strftime('%Y-%m-%d'),
+            'to': to_date.strftime('%Y-%m-%d'),
+            'sort_by': 'relevancy',  # Sort by relevancy to the query
+            'page_size': page_size
+        }
+        
         try:
-            # Search for articles using everything endpoint
-            response = self.client.get_everything(
-                q=query,
-                language=language,
-                from_param=from_date.strftime('%Y-%m-%d'),
-                to=to_date.strftime('%Y-%m-%d'),
-                sort_by='relevancy',  # Sort by relevancy to the query
-                page_size=page_size
-            )
+            total_pages = max(1, min(MAX_PAGES, math.ceil(max_results / page_size)))
             
+            if total_pages == 1:
+                # The common case; a thread pool would only add start-up cost
+                responses = [self._fetch_page(1, **params)]
+            else:
+                # Pages are independent network round-trips, so fetch them concurrently;
+                # map() yields responses in page order
+                with ThreadPoolExecutor(max_workers=total_pages) as executor:
+                    responses = list(executor.map(
+                        lambda page: self._fetch_page(page, **params),
+                        range(1, total_pages + 1)
+                    ))
+            
+            response = responses[0]
             if response['status'] == 'ok':
-                articles = response['articles']
-                
                 # Clean and normalize article data
                 cleaned_articles = []
-                for article in articles:
-                    cleaned_article = {
-                        'title': article.get('title', 'N/A'),
-                        'url': article.get('url', 'N/A'),
-                        'published_at': article.get('publishedAt', 'N/A'),
-                        'source': article.get('source', {}).get('name', 'N/A'),
-                        'description': article.get('description', 'N/A'),
-                        'author': article.get('author', 'N/A')
-                    }
-                    cleaned_articles.append(cleaned_article)
+                for page_response in responses:
+                    if page_response.get('status') != 'ok':
+                        continue
+                    for article in page_response['articles']:
+                        cleaned_article = {
+                            'title': article.get('title', 'N/A'),
+                            'url': article.get('url', 'N/A'),
+                            'published_at': article.get('publishedAt', 'N/A'),
+                            'source': article.get('source', {}).get('name', 'N/A'),
+                            'description': article.get('description', 'N/A'),
+                            'author': article.get('author', 'N/A')
+                        }
+                        cleaned_articles.append(cleaned_article)
                 
-                return cleaned_articles
+                cleaned_articles = cleaned_articles[:max_results]
+                
+                # Only complete searches are cached; a page that failed for any reason other
+                # than the plan's result limit makes the next identical search retry
+                if all(
+                    page_response.get('status') == 'ok'
+                    or page_response.get('code') == 'maximumResultsReached'
+                    for page_response in responses
+                ):
+                    self._search_cache[cache_key] = cleaned_articles
+                    if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
+                
+                return [dict(article) for article in cleaned_articles]
             else:
                 print(t('errors.newsapi_error', error=response.get('message', 'Unknown error')))
                 return []
@@ -84,10 +154,37 @@ class NewsAPIClient:
             print(t('errors.fetch_news', error=str(e)))
             return []
     
-    def format_published_date(self, date_string: str) -> str:
+    def _fetch_page(self, page: int, **params) -> Dict:
+        """
+        Fetch a single page of results from the everything endpoint.
+        
+        Failures on pages after the first are reported as an error response
+        (with the NewsAPI error code, when there is one) so that the articles
+        from earlier pages are still returned.
+        
+        Args:
+            page: 1-based page number
+            **params: Query parameters passed to get_everything
+            
+        Returns:
+            Raw API response dictionary
+        """
+        try:
+            return self.client.get_everything(page=page, **params)
+        except Exception as e:
+            if page == 1:
+                raise
+            code = e.get_code() if isinstance(e, NewsAPIException) else None
+            return {'status': 'error', 'code': code, 'message': str(e)}
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_published_date(date_string: str) -> str:
         """
         Format the published date from ISO format to readable format.
         
+        Results are cached, since the same timestamps recur across searches.
+        
         Args:
             date_string: ISO format date string
             
@@ -95,6 +192,11 @@ class NewsAPIClient:
             Formatted date string
         """
         try:
+            # Fast path: reuse the date and time digits as-is, no parsing needed
+            match = _ISO_DATETIME.fullmatch(date_string)
+            if match:
+                return f"{match.group(1)} {match.group(2)}"
+            
             dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
             return dt.strftime('%Y-%m-%d %H:%M:%S')
         except:
@@ -3,13 +3,16 @@ Summarizer module.
 Handles generating summaries of news article headlines using transformers.
 """
 from typing import List, Dict
-from transformers import pipeline
+import threading
 import warnings
 from src.i18n import t
 
 # Suppress warnings from transformers
 warnings.filterwarnings('ignore')
 
+# DistilBART keeps ~97% of BART-large-CNN's ROUGE with ~2x faster CPU inference
+MODEL_NAME = "sshleifer/distilbart-cnn-12-6"
+
 
 class Summarizer:
     """Generates summaries of news article headlines."""
@@ -17,22 +20,150 @@ class Summarizer:
     def __init__(self):
         """Initialize the summarization pipeline."""
         self.pipeline = None
+        # Serializes loading between a background warm-up and the first search
+        self._pipeline_lock = threading.Lock()
+    
+    def warm_up(self):
+        """
+        Load the summarization model ahead of time without any console output.
+        
+        Only a model that is already in the local cache is loaded, so no download
+        progress bars are drawn over the input prompts; otherwise the first search
+        downloads and loads it as usual.
+        """
+        self._initialize_pipeline(verbose=False)
     
-    def _initialize_pipeline(self):
-        """Lazy initialization of the summarization pipeline."""
-        if self.pipeline is None:
+    def prepare(self, articles: List[Dict]):
+        """
+        Load the model now if summarize_headlines would use it for these articles.
+        
+        Lets callers finish loading, and its console output, before summarizing
+        alongside other work.
+        
+        Args:
+            articles: List of article dictionaries containing 'title' field
+        """
+        headlines = [article.get('title', '') for article in articles if article.get('title')]
+        if self._needs_model(headlines):
+            self._initialize_pipeline()
+    
+    @staticmethod
+    def _needs_model(headlines: List[str]) -> bool:
+        """
+        Check whether there is enough text for the model to beat the extractive summary.
+        
+        Args:
+            headlines: List of headline strings
+            
+        Returns:
+            True if the transformer model should be used
+        """
+        word_count = sum(len(headline.split()) for headline in headlines)
+        return len(headlines) >= 8 and word_count >= 80
+    
+    def _initialize_pipeline(self, verbose: bool = True):
+        """
+        Lazy initialization of the summarization pipeline.
+        
+        Args:
+            verbose: Whether to print loading progress and errors. Quiet loads
+                also silence transformers logging and are skipped unless the
+                model is already cached locally.
+        """
+        if self.pipeline is not None:
+            return
+        
+        # Announce before waiting, so a search that waits on a running warm-up isn't a silent hang
+        if verbose:
             print(t('summarizer.loading'))
-            try:
-                # Using a lightweight model suitable for summarization
-                self.pipeline = pipeline(
-                    "summarization",
-                    model="facebook/bart-large-cnn",
-                    device=-1  # Use CPU
-                )
+        
+        with self._pipeline_lock:
+            if self.pipeline is None:
+                self._load_pipeline(verbose)
+            
+            if verbose and self.pipeline is not None:
                 print(t('summarizer.loaded'))
-            except Exception as e:
+    
+    def _load_pipeline(self, verbose: bool):
+        """
+        Create the summarization pipeline; must be called with _pipeline_lock held.
+        
+        Args:
+            verbose: Whether to print errors; quiet loads only use a cached model
+        """
+        try:
+            # Imported lazily: transformers (and torch) take seconds to import
+            from transformers import logging as hf_logging, pipeline
+        except Exception as e:
+            if verbose:
+                print(t('summarizer.error', error=str(e)))
+            return
+        
+        # Quiet loads must not download, or progress bars would draw over the prompts
+        if not verbose and not self._model_is_cached():
+            return
+        
+        previous_verbosity = hf_logging.get_verbosity()
+        if not verbose:
+            hf_logging.set_verbosity_error()
+        
+        def create_pipeline():
+            return pipeline(
+                "summarization",
+                model=MODEL_NAME,
+                framework="pt",
+                device=-1  # Use CPU
+            )
+        
+        try:
+            # Build and quantize a local pipeline; it is published only once complete,
+            # since searches skip the lock as soon as self.pipeline is set
+            pipe = create_pipeline()
+            if not self._quantize_model(pipe):
+                # A failed in-place quantization may leave the model half converted
+                pipe = create_pipeline()
+            self.pipeline = pipe
+        except Exception as e:
+            if verbose:
                 print(t('summarizer.error', error=str(e)))
-                self.pipeline = None
+            self.pipeline = None
+        finally:
+            hf_logging.set_verbosity(previous_verbosity)
+    
+    @staticmethod
+    def _model_is_cached() -> bool:
+        """
+        Check whether the summarization model is already in the local Hugging Face cache.
+        
+        Returns:
+            True if the model's config file is cached, False otherwise
+        """
+        try:
+            from huggingface_hub import try_to_load_from_cache
+            return isinstance(try_to_load_from_cache(MODEL_NAME, 'config.json'), str)
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _quantize_model(pipe) -> bool:
+        """
+        Quantize a pipeline's linear layers to int8 in place for faster CPU inference.
+        
+        Args:
+            pipe: Summarization pipeline whose model is converted
+            
+        Returns:
+            True on success; on False the model may be partially converted and must be discarded
+        """
+        try:
+            import torch
+            # In place: copying first would briefly hold a second full FP32 model in memory
+            pipe.model = torch.ao.quantization.quantize_dynamic(
+                pipe.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            return True
+        except Exception:
+            return False
     
     def summarize_headlines(self, articles: List[Dict], max_length: int = 150) -> str:
         """
@@ -54,26 +185,22 @@ class Summarizer:
         if not headlines:
             return t('summarizer.no_headlines')
         
-        # Join headlines with periods
-        combined_text = ". ".join(headlines) + "."
+        word_count = sum(len(headline.split()) for headline in headlines)
         
-        # If text is too short, return as is
-        if len(combined_text.split()) < 50:
-            return f"Combined Headlines: {combined_text}"
+        # If text is too short, return the headlines joined with periods
+        if word_count < 50:
+            return f"Combined Headlines: {'. '.join(headlines)}."
+        
+        # Too little input for the model to beat the extractive summary; skip loading it
+        if not self._needs_model(headlines):
+            return self._fallback_summary(headlines)
         
         # Try to use the transformer model
         self._initialize_pipeline()
         
         if self.pipeline:
             try:
-                # Limit input size to avoid token limit issues
-                max_input_length = 1024
-                if len(combined_text) > max_input_length:
-                    # Truncate text intelligently at sentence boundaries
-                    combined_text = combined_text[:max_input_length]
-                    last_period = combined_text.rfind('.')
-                    if last_period > 0:
-                        combined_text = combined_text[:last_period + 1]
+                combined_text = self._build_model_input(headlines)
                 
                 summary = self.pipeline(
                     combined_text,
@@ -90,6 +217,33 @@ class Summarizer:
         else:
             return self._fallback_summary(headlines)
     
+    @staticmethod
+    def _build_model_input(headlines: List[str], max_input_length: int = 1024) -> str:
+        """
+        Join whole headlines with periods, stopping before the input size limit.
+        
+        Args:
+            headlines: List of headline strings
+            max_input_length: Maximum number of characters to feed the model
+            
+        Returns:
+            Model input text ending at a headline boundary
+        """
+        parts = []
+        total_length = 0
+        for headline in headlines:
+            # Each headline costs its own length plus the ". " separator
+            total_length += len(headline) + 2
+            if total_length > max_input_length:
+                break
+            parts.append(headline)
+        
+        if not parts:
+            # A single over-long headline: hard-truncate it
+            return headlines[0][:max_input_length - 1] + "."
+        
+        return ". ".join(parts) + "."
+    
     def _fallback_summary(self, headlines: List[str]) -> str:
         """
         Fallback summary method using simple extraction.
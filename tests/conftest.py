@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures and configuration for all tests.
+"""
+import pytest
+from src.entity_extractor import EntityExtractor
+from src.i18n import Translator
+from src.summarizer import Summarizer
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "requires_model: needs an installed spaCy model (e.g. en_core_web_sm) to be meaningful"
+    )
+
+
+@pytest.fixture(scope="session")
+def entity_extractor():
+    """
+    English entity extractor shared by the whole test session.
+
+    The spaCy model is loaded at most once per run instead of once per test.
+    """
+    return EntityExtractor(language='en')
+
+
+@pytest.fixture(scope="session")
+def summarizer():
+    """
+    Summarizer shared by the whole test session.
+
+    The transformer pipeline is loaded at most once per run instead of once per test.
+    """
+    return Summarizer()
+
+
+@pytest.fixture(scope="session")
+def translator():
+    """
+    Translator shared by the whole test session.
+
+    Tests must set the language they rely on, since the instance is shared.
+    """
+    return Translator()
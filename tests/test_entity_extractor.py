@@ -2,7 +2,43 @@
 Unit tests for entity extractor module.
 """
 import pytest
-from src.entity_extractor import EntityExtractor
+from types import MappingProxyType
+from unittest.mock import Mock
+from src.entity_extractor import EntityExtractor, _load_spacy_model
+from src.i18n import set_language
+
+
+# Read-only sample data shared by every test in this module
+SAMPLE_ARTICLES = (
+    MappingProxyType({'title': 'Apple releases new iPhone in California'}),
+    MappingProxyType({'title': 'Microsoft announces partnership with OpenAI'}),
+    MappingProxyType({'title': 'Apple and Microsoft compete in tech market'}),
+    MappingProxyType({'title': 'President Biden visits New York'})
+)
+
+# The same headlines as plain strings, for the title-only API
+SAMPLE_TITLES = tuple(article['title'] for article in SAMPLE_ARTICLES)
+
+
+@pytest.fixture(scope="session")
+def warm_entity_extractor(entity_extractor):
+    """Shared extractor whose headline cache already holds the sample articles."""
+    entity_extractor.extract_entities(SAMPLE_ARTICLES)
+    return entity_extractor
+
+
+@pytest.fixture
+def blank_extractor(monkeypatch):
+    """
+    English extractor backed by a blank spaCy pipeline instead of a downloaded model.
+    
+    Enough for tests that only check output shape; no model files are read.
+    """
+    import spacy
+    monkeypatch.setattr('src.entity_extractor._load_spacy_model', lambda model_name: spacy.blank('en'))
+    extractor = EntityExtractor(language='en')
+    extractor.warm_up()
+    return extractor
 
 
 class TestEntityExtractor:
@@ -10,17 +46,12 @@ class TestEntityExtractor:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.extractor = EntityExtractor(language='en')
-        self.sample_articles = [
-            {'title': 'Apple releases new iPhone in California'},
-            {'title': 'Microsoft announces partnership with OpenAI'},
-            {'title': 'Apple and Microsoft compete in tech market'},
-            {'title': 'President Biden visits New York'}
-        ]
+        self.sample_articles = SAMPLE_ARTICLES
     
-    def test_extract_entities_basic(self):
+    @pytest.mark.requires_model
+    def test_extract_entities_basic(self, warm_entity_extractor):
         """Test basic entity extraction."""
-        entities = self.extractor.extract_entities(self.sample_articles)
+        entities = warm_entity_extractor.extract_entities(self.sample_articles)
         
         # Should find some entities
         assert len(entities) > 0
@@ -32,21 +63,42 @@ class TestEntityExtractor:
             assert isinstance(count, int)
             assert count > 0
     
-    def test_extract_entities_frequency(self):
+    @pytest.mark.requires_model
+    def test_extract_entities_frequency(self, warm_entity_extractor):
         """Test that entities are sorted by frequency."""
-        entities = self.extractor.extract_entities(self.sample_articles)
+        entities = warm_entity_extractor.extract_entities(self.sample_articles)
         
         if len(entities) > 1:
             # Check that frequencies are in descending order
             for i in range(len(entities) - 1):
                 assert entities[i][2] >= entities[i + 1][2]
     
-    def test_extract_entities_empty(self):
-        """Test entity extraction with empty articles."""
-        entities = self.extractor.extract_entities([])
-        assert entities == []
+    @pytest.mark.requires_model
+    def test_extract_entities_top_k(self, warm_entity_extractor):
+        """Test that only the top_k most frequent entities are returned."""
+        all_entities = warm_entity_extractor.extract_entities(self.sample_articles)
+        top_entities = warm_entity_extractor.extract_entities(self.sample_articles, top_k=2)
+        
+        assert top_entities == all_entities[:2]
+    
+    @pytest.mark.parametrize("method,expected", [
+        ('extract_entities', []),
+        ('format_entities_output', 'No named entities found.')
+    ])
+    def test_empty_inputs(self, entity_extractor, method, expected):
+        """Test that empty input gives an empty result or the 'nothing found' message."""
+        # The message comes from the global translator
+        set_language('en')
+        
+        assert getattr(entity_extractor, method)([]) == expected
+    
+    def test_extract_entities_from_titles_matches_articles(self, warm_entity_extractor):
+        """Test that a tuple of titles gives the same entities as the article dictionaries."""
+        from_titles = warm_entity_extractor.extract_entities_from_titles(SAMPLE_TITLES + ('', 'N/A'))
+        
+        assert from_titles == warm_entity_extractor.extract_entities(self.sample_articles)
     
-    def test_format_entities_output(self):
+    def test_format_entities_output(self, blank_extractor):
         """Test entity output formatting."""
         entities = [
             ('Apple', 'ORG', 3),
@@ -54,7 +106,7 @@ class TestEntityExtractor:
             ('Biden', 'PERSON', 1)
         ]
         
-        output = self.extractor.format_entities_output(entities)
+        output = blank_extractor.format_entities_output(entities)
         
         assert 'Apple' in output
         assert 'Microsoft' in output
@@ -62,7 +114,74 @@ class TestEntityExtractor:
         assert 'ORG' in output
         assert 'PERSON' in output
     
-    def test_format_entities_empty(self):
-        """Test formatting empty entities list."""
-        output = self.extractor.format_entities_output([])
-        assert 'No named entities found' in output
+    def test_fallback_entities(self):
+        """Test the capitalized-word heuristic used when no spaCy model is available."""
+        titles = ['The Apple CEO visits "Berlin", not paris', 'Apple and Microsoft']
+        
+        entities = list(EntityExtractor._fallback_entities(titles))
+        
+        assert entities == [
+            ('Apple', 'UNKNOWN'),
+            ('CEO', 'UNKNOWN'),
+            ('Berlin', 'UNKNOWN'),
+            ('Apple', 'UNKNOWN'),
+            ('Microsoft', 'UNKNOWN')
+        ]
+    
+    def test_spacy_model_shared_between_extractors(self, monkeypatch):
+        """Test that extractors for the same language share one loaded spaCy model."""
+        import spacy
+        load = Mock(return_value=spacy.blank('en'))
+        monkeypatch.setattr(spacy, 'load', load)
+        _load_spacy_model.cache_clear()
+        
+        try:
+            first = EntityExtractor(language='en')
+            second = EntityExtractor(language='en')
+            first._load_model()
+            second._load_model()
+            
+            assert first.nlp is second.nlp
+            load.assert_called_once()
+        finally:
+            _load_spacy_model.cache_clear()
+    
+    def test_missing_model_reported_once(self, monkeypatch, capsys):
+        """Test that a missing spaCy model is reported once, not on every search."""
+        monkeypatch.setattr('src.entity_extractor._load_spacy_model', Mock(side_effect=OSError))
+        extractor = EntityExtractor(language='en')
+        
+        extractor.warm_up()
+        assert capsys.readouterr().out == ''
+        
+        extractor._load_model()
+        first = capsys.readouterr().out
+        extractor.extract_entities(SAMPLE_ARTICLES)
+        
+        assert 'en_core_web_sm' in first
+        assert capsys.readouterr().out == ''
+    
+    def test_fallback_entities_keeps_inner_punctuation(self):
+        """Test that only leading/trailing punctuation is trimmed from candidates."""
+        entities = list(EntityExtractor._fallback_entities(["Biden's Rolls-Royce deal."]))
+        
+        assert entities == [("Biden's", 'UNKNOWN'), ('Rolls-Royce', 'UNKNOWN')]
+    
+    def test_repeated_headlines_reuse_cached_entities(self):
+        """Test that headlines seen before are not sent through spaCy again."""
+        import spacy
+        nlp = spacy.blank('en')
+        nlp.add_pipe('entity_ruler').add_patterns([
+            {'label': 'ORG', 'pattern': 'Apple'},
+            {'label': 'ORG', 'pattern': 'Microsoft'}
+        ])
+        extractor = EntityExtractor(language='en')
+        extractor.nlp = Mock(pipe=Mock(side_effect=nlp.pipe))
+        
+        first = extractor.extract_entities(self.sample_articles)
+        second = extractor.extract_entities(self.sample_articles + ({'title': 'Microsoft wins'},))
+        
+        assert first == [('Apple', 'ORG', 2), ('Microsoft', 'ORG', 2)]
+        assert second == [('Microsoft', 'ORG', 3), ('Apple', 'ORG', 2)]
+        assert extractor.nlp.pipe.call_count == 2
+        assert extractor.nlp.pipe.call_args_list[1][0][0] == ['Microsoft wins']
@@ -1,75 +1,97 @@
 """
 Unit tests for i18n (internationalization) module.
 """
-import os
 import json
+import pytest
 from pathlib import Path
-from src.i18n import Translator, set_language, t
+from src.i18n import Translator, _load_translation_file, set_language, t
+
+
+@pytest.fixture(scope="session")
+def translation_files():
+    """Raw contents of the translation files, parsed once per test session."""
+    translations_dir = Path(__file__).parent.parent / 'translations'
+    return {
+        lang: json.loads((translations_dir / f'{lang}.json').read_bytes())
+        for lang in ('en', 'de')
+    }
 
 
 class TestTranslator:
     """Test cases for Translator class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.translator = Translator()
+    @pytest.fixture(autouse=True)
+    def reset_language(self, translator):
+        """Start every test from English, since the translator is shared."""
+        translator.set_language('en')
     
     def test_translator_initialization(self):
         """Test translator initializes with default language."""
-        assert self.translator.current_language == 'en'
-        assert 'en' in self.translator.translations
-        assert 'de' in self.translator.translations
+        translator = Translator()
+        assert translator.current_language == 'en'
+        assert 'en' in translator.translations
+        assert 'de' in translator.translations
     
-    def test_set_language_english(self):
+    def test_set_language_english(self, translator):
         """Test setting language to English."""
-        self.translator.set_language('en')
-        assert self.translator.current_language == 'en'
+        translator.set_language('en')
+        assert translator.current_language == 'en'
     
-    def test_set_language_german(self):
+    def test_set_language_german(self, translator):
         """Test setting language to German."""
-        self.translator.set_language('de')
-        assert self.translator.current_language == 'de'
+        translator.set_language('de')
+        assert translator.current_language == 'de'
     
-    def test_set_language_unsupported_fallback(self):
+    def test_set_language_unsupported_fallback(self, translator):
         """Test unsupported language falls back to English."""
-        self.translator.set_language('fr')  # French not supported
-        assert self.translator.current_language == 'en'
+        translator.set_language('fr')  # French not supported
+        assert translator.current_language == 'en'
     
-    def test_translate_simple_key_english(self):
+    def test_translate_simple_key_english(self, translator):
         """Test simple translation in English."""
-        self.translator.set_language('en')
-        result = self.translator.t('app.title')
+        translator.set_language('en')
+        result = translator.t('app.title')
         assert result == 'News Search Engine'
     
-    def test_translate_simple_key_german(self):
+    def test_translate_simple_key_german(self, translator):
         """Test simple translation in German."""
-        self.translator.set_language('de')
-        result = self.translator.t('app.title')
+        translator.set_language('de')
+        result = translator.t('app.title')
         assert result == 'Nachrichten-Suchmaschine'
     
-    def test_translate_nested_key(self):
+    def test_translate_nested_key(self, translator):
         """Test translation with nested keys (dot notation)."""
-        self.translator.set_language('en')
-        result = self.translator.t('search.prompt')
+        translator.set_language('en')
+        result = translator.t('search.prompt')
         assert 'topic' in result.lower()
     
-    def test_translate_with_format_arguments(self):
+    def test_translate_with_format_arguments(self, translator):
         """Test translation with string formatting."""
-        self.translator.set_language('en')
-        result = self.translator.t('search.found', count=5)
+        translator.set_language('en')
+        result = translator.t('search.found', count=5)
         assert '5' in result
         assert 'articles' in result.lower()
     
-    def test_translate_missing_key_returns_key(self):
+    def test_translate_missing_key_returns_key(self, translator):
         """Test that missing translation key returns the key itself."""
-        result = self.translator.t('nonexistent.key')
+        result = translator.t('nonexistent.key')
         assert result == 'nonexistent.key'
     
-    def test_translate_invalid_format_args(self):
+    def test_translate_missing_german_key_falls_back_to_english(self):
+        """Test that a key missing from German falls back to the English text."""
+        translator = Translator()
+        translator.set_language('de')
+        assert translator.t('app.title') == 'Nachrichten-Suchmaschine'
+        
+        del translator.translations['de']['app.title']
+        result = translator.t('app.title')
+        assert result == 'News Search Engine'
+    
+    def test_translate_invalid_format_args(self, translator):
         """Test translation handles invalid format arguments gracefully."""
-        self.translator.set_language('en')
+        translator.set_language('en')
         # Try to format with wrong arguments
-        result = self.translator.t('search.found', wrong_arg='value')
+        result = translator.t('search.found', wrong_arg='value')
         # Should return the string, possibly unformatted
         assert isinstance(result, str)
     
@@ -88,42 +110,75 @@ class TestTranslator:
         result = t('app.welcome')
         assert 'Welcome' in result
     
-    def test_translation_files_exist(self):
+    def test_translation_files_exist(self, translation_files):
         """Test that translation files exist and are valid JSON."""
-        translations_dir = Path(__file__).parent.parent / 'translations'
-        
         # Check English translation file
-        en_file = translations_dir / 'en.json'
-        assert en_file.exists()
-        with open(en_file, 'r', encoding='utf-8') as f:
-            en_data = json.load(f)
-            assert isinstance(en_data, dict)
-            assert 'app' in en_data
+        en_data = translation_files['en']
+        assert isinstance(en_data, dict)
+        assert 'app' in en_data
         
         # Check German translation file
-        de_file = translations_dir / 'de.json'
-        assert de_file.exists()
-        with open(de_file, 'r', encoding='utf-8') as f:
-            de_data = json.load(f)
-            assert isinstance(de_data, dict)
-            assert 'app' in de_data
-    
-    def test_translation_completeness(self):
+        de_data = translation_files['de']
+        assert isinstance(de_data, dict)
+        assert 'app' in de_data
+    
+    def test_translation_completeness(self, translation_files):
         """Test that German translations have same keys as English."""
-        en_keys = self._get_all_keys(self.translator.translations['en'])
-        de_keys = self._get_all_keys(self.translator.translations['de'])
+        en_keys = self._get_all_keys(translation_files['en'])
+        de_keys = self._get_all_keys(translation_files['de'])
         
         # German should have all English keys (allowing for extras)
         missing_keys = en_keys - de_keys
         assert len(missing_keys) == 0, f"Missing German translations for: {missing_keys}"
     
-    def _get_all_keys(self, d, parent_key=''):
+    def test_translation_files_parsed_once(self):
+        """Test that separate Translators share parsing but not their dictionaries."""
+        first = Translator()
+        hits_before = _load_translation_file.cache_info().hits
+        second = Translator()
+        
+        assert _load_translation_file.cache_info().hits == hits_before + len(second.translations)
+        assert first.translations['en'] == second.translations['en']
+        assert first.translations['en'] is not second.translations['en']
+    
+    def test_formatted_translations_are_cached_per_language(self):
+        """Test that repeated formatted lookups are cached without mixing languages."""
+        translator = Translator()
+        first = translator.t('ner.loading', model='en_core_web_sm')
+        second = translator.t('ner.loading', model='en_core_web_sm')
+        translator.set_language('de')
+        german = translator.t('ner.loading', model='en_core_web_sm')
+        
+        assert first == second == 'Loading NER model (en_core_web_sm)...'
+        assert german == 'Lade NER-Modell (en_core_web_sm)...'
+        assert len(translator._formatted) == 2
+    
+    def test_clear_cache_picks_up_changed_translations(self):
+        """Test that clear_cache() drops formatted strings built from old templates."""
+        translator = Translator()
+        assert translator.t('ner.loading', model='x') == 'Loading NER model (x)...'
+        
+        translator.translations['en']['ner.loading'] = 'Model {model}'
+        translator.clear_cache()
+        
+        assert translator.t('ner.loading', model='x') == 'Model x'
+    
+    def test_translate_with_unhashable_format_arguments(self, translator):
+        """Test that unhashable format arguments bypass the cache but still format."""
+        result = translator.t('ner.loading', model=['en_core_web_sm'])
+        assert result == "Loading NER model (['en_core_web_sm'])..."
+    
+    def _get_all_keys(self, d):
         """Helper to get all nested keys from translation dictionary."""
         keys = set()
-        for k, v in d.items():
-            new_key = f"{parent_key}.{k}" if parent_key else k
-            if isinstance(v, dict):
-                keys.update(self._get_all_keys(v, new_key))
-            else:
-                keys.add(new_key)
+        # Iterative walk: no recursion frames and no recursion-limit risk on deep schemas
+        stack = [(d, '')]
+        while stack:
+            node, prefix = stack.pop()
+            for k, v in node.items():
+                key = prefix + '.' + k if prefix else k
+                if isinstance(v, dict):
+                    stack.append((v, key))
+                else:
+                    keys.add(key)
         return keys
@@ -1,70 +1,81 @@
 """
 Unit tests for news API client module.
 """
-import os
-from unittest.mock import patch, Mock
-from src.news_api import NewsAPIClient
+import json
+import pytest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+from newsapi.newsapi_exception import NewsAPIException
+from src.news_api import NewsAPIClient, MAX_PAGES
+
+
+@pytest.fixture(autouse=True, scope="module")
+def newsapi_key():
+    """Provide a fake API key for every test in this module, patched once."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('NEWSAPI_KEY', 'test_api_key_12345')
+        yield
+
+
+@pytest.fixture(scope="session")
+def canned_responses():
+    """Canned NewsAPI get_everything responses, loaded once per test session."""
+    fixtures_dir = Path(__file__).parent / 'fixtures'
+    return json.loads((fixtures_dir / 'newsapi_responses.json').read_bytes())
+
+
+@pytest.fixture
+def mock_newsapi_class(monkeypatch):
+    """Replace the newsapi-python client class with a MagicMock."""
+    mock_cls = MagicMock()
+    monkeypatch.setattr('src.news_api.NewsApiClient', mock_cls)
+    return mock_cls
+
+
+@pytest.fixture
+def mock_newsapi(mock_newsapi_class):
+    """
+    Mocked newsapi-python client instance used by every NewsAPIClient created in the test.
+
+    Tests only set get_everything.return_value or side_effect.
+    """
+    return mock_newsapi_class.return_value
 
 
 class TestNewsAPIClient:
     """Test cases for NewsAPIClient class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Mock the API key to avoid requiring real one
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_api_key_12345'}):
-            self.client = NewsAPIClient()
-    
-    @patch('src.news_api.NewsApiClient')
-    def test_initialization_with_api_key(self, mock_newsapi):
+    def test_initialization_with_api_key(self, mock_newsapi_class):
         """Test NewsAPIClient initializes with API key from environment."""
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            mock_newsapi.assert_called_once_with(api_key='test_key')
+        client = NewsAPIClient()
+        mock_newsapi_class.assert_called_once_with(api_key='test_api_key_12345', session=client.session)
     
-    @patch('src.news_api.load_dotenv')  # Mock load_dotenv to prevent reading .env file
-    def test_initialization_without_api_key_raises_error(self, mock_load_dotenv):
+    def test_session_pool_fits_parallel_pages(self):
+        """Test that the shared session can keep one connection per parallel page."""
+        client = NewsAPIClient()
+        adapter = client.session.get_adapter('https://newsapi.org/v2/everything')
+        assert adapter._pool_maxsize >= MAX_PAGES
+    
+    def test_initialization_without_api_key_raises_error(self, monkeypatch):
         """Test NewsAPIClient raises ValueError when API key is missing."""
-        with patch.dict(os.environ, {}, clear=True):
-            try:
-                client = NewsAPIClient()
-                assert False, "Should have raised ValueError"
-            except ValueError as e:
-                assert 'NEWSAPI_KEY' in str(e)
-    
-    @patch('src.news_api.NewsApiClient')
-    def test_search_news_success(self, mock_newsapi):
+        monkeypatch.delenv('NEWSAPI_KEY', raising=False)
+        # Prevent load_dotenv from reading a local .env file
+        monkeypatch.setattr('src.news_api.load_dotenv', Mock())
+        try:
+            client = NewsAPIClient()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert 'NEWSAPI_KEY' in str(e)
+    
+    def test_search_news_success(self, mock_newsapi, canned_responses):
         """Test successful news search."""
-        # Arrange - Mock API response
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
-            'status': 'ok',
-            'totalResults': 2,
-            'articles': [
-                {
-                    'title': 'Test Article 1',
-                    'url': 'https://example.com/1',
-                    'publishedAt': '2026-01-15T10:00:00Z',
-                    'source': {'name': 'Test Source'},
-                    'author': 'Test Author',
-                    'description': 'Test description'
-                },
-                {
-                    'title': 'Test Article 2',
-                    'url': 'https://example.com/2',
-                    'publishedAt': '2026-01-16T12:00:00Z',
-                    'source': {'name': 'Another Source'},
-                    'author': 'Another Author',
-                    'description': 'Another description'
-                }
-            ]
-        }
-        mock_newsapi.return_value = mock_instance
+        # Arrange - canned API response
+        mock_newsapi.get_everything.return_value = canned_responses['success_en']
         
         # Act
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('artificial intelligence', language='en')
+        client = NewsAPIClient()
+        results = client.search_news('artificial intelligence', language='en')
         
         # Assert
         assert len(results) == 2
@@ -72,130 +83,88 @@ class TestNewsAPIClient:
         assert results[1]['title'] == 'Test Article 2'
         
         # Verify API was called correctly
-        mock_instance.get_everything.assert_called_once()
-        call_kwargs = mock_instance.get_everything.call_args[1]
+        mock_newsapi.get_everything.assert_called_once()
+        call_kwargs = mock_newsapi.get_everything.call_args[1]
         assert call_kwargs['q'] == 'artificial intelligence'
         assert call_kwargs['language'] == 'en'
         assert call_kwargs['sort_by'] == 'relevancy'
     
-    @patch('src.news_api.NewsApiClient')
-    def test_search_news_german_language(self, mock_newsapi):
+    def test_search_news_german_language(self, mock_newsapi, canned_responses):
         """Test news search with German language."""
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
-            'status': 'ok',
-            'totalResults': 1,
-            'articles': [
-                {
-                    'title': 'Deutsche Nachrichten',
-                    'url': 'https://example.de/1',
-                    'publishedAt': '2026-01-15T10:00:00Z',
-                    'source': {'name': 'Test Quelle'},
-                    'author': 'Test Autor',
-                    'description': 'Test Beschreibung'
-                }
-            ]
-        }
-        mock_newsapi.return_value = mock_instance
+        mock_newsapi.get_everything.return_value = canned_responses['success_de']
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('künstliche intelligenz', language='de')
+        client = NewsAPIClient()
+        results = client.search_news('künstliche intelligenz', language='de')
         
         assert len(results) == 1
-        call_kwargs = mock_instance.get_everything.call_args[1]
+        call_kwargs = mock_newsapi.get_everything.call_args[1]
         assert call_kwargs['language'] == 'de'
     
-    @patch('src.news_api.NewsApiClient')
-    def test_search_news_empty_results(self, mock_newsapi):
+    def test_search_news_empty_results(self, mock_newsapi, canned_responses):
         """Test news search with no results."""
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
-            'status': 'ok',
-            'totalResults': 0,
-            'articles': []
-        }
-        mock_newsapi.return_value = mock_instance
+        mock_newsapi.get_everything.return_value = canned_responses['empty']
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('nonexistent topic')
+        client = NewsAPIClient()
+        results = client.search_news('nonexistent topic')
         
         assert results == []
     
-    @patch('src.news_api.NewsApiClient')
     def test_search_news_api_error(self, mock_newsapi):
         """Test news search handles API errors gracefully."""
-        mock_instance = Mock()
-        mock_instance.get_everything.side_effect = Exception('API Error')
-        mock_newsapi.return_value = mock_instance
+        mock_newsapi.get_everything.side_effect = Exception('API Error')
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('test query')
+        client = NewsAPIClient()
+        results = client.search_news('test query')
         
         # Should return empty list on error
         assert results == []
     
-    @patch('src.news_api.NewsApiClient')
-    def test_search_news_invalid_response(self, mock_newsapi):
+    def test_search_news_invalid_response(self, mock_newsapi, canned_responses):
         """Test news search handles invalid API response."""
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
-            'status': 'error',
-            'message': 'Invalid API key'
-        }
-        mock_newsapi.return_value = mock_instance
+        mock_newsapi.get_everything.return_value = canned_responses['invalid']
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('test query')
+        client = NewsAPIClient()
+        results = client.search_news('test query')
         
         assert results == []
     
     def test_format_published_date(self):
         """Test date formatting."""
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            
-            # Test ISO format
-            formatted = client.format_published_date('2026-01-15T10:30:00Z')
-            assert '2026' in formatted
-            assert '01' in formatted or 'Jan' in formatted
-            assert '15' in formatted
+        # Test ISO format
+        formatted = NewsAPIClient.format_published_date('2026-01-15T10:30:00Z')
+        assert '2026' in formatted
+        assert '01' in formatted or 'Jan' in formatted
+        assert '15' in formatted
+    
+    def test_format_published_date_fast_path_matches_parser(self):
+        """Test that NewsAPI timestamps format the same as the datetime parser would."""
+        assert NewsAPIClient.format_published_date('2026-01-15T10:30:00Z') == '2026-01-15 10:30:00'
+        assert NewsAPIClient.format_published_date('2026-01-15T10:30:00.123+02:00') == '2026-01-15 10:30:00'
+        # Formats without a time component still go through the parser
+        assert NewsAPIClient.format_published_date('2026-01-15') == '2026-01-15 00:00:00'
+    
+    def test_format_published_date_malformed_timestamps_unchanged(self):
+        """Test that timestamp-shaped but invalid strings are not reformatted."""
+        for invalid_date in ['2026-13-45T99:99:99Z', '2026-02-30T10:00:00Z', '2026-01-15T10:30:00Zjunk']:
+            assert NewsAPIClient.format_published_date(invalid_date) == invalid_date
+    
+    def test_format_published_date_missing_value(self):
+        """Test that a null publishedAt is returned as-is instead of raising."""
+        assert NewsAPIClient.format_published_date(None) is None
     
     def test_format_published_date_invalid(self):
         """Test date formatting with invalid date string."""
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            
-            # Invalid date should be returned as-is
-            invalid_date = 'not-a-date'
-            formatted = client.format_published_date(invalid_date)
-            assert formatted == invalid_date
-    
-    @patch('src.news_api.NewsApiClient')
-    def test_article_transformation(self, mock_newsapi):
+        # Invalid date should be returned as-is
+        invalid_date = 'not-a-date'
+        formatted = NewsAPIClient.format_published_date(invalid_date)
+        assert formatted == invalid_date
+    
+    def test_article_transformation(self, mock_newsapi, canned_responses):
         """Test article data transformation/normalization."""
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
-            'status': 'ok',
-            'articles': [
-                {
-                    'title': 'Test',
-                    'url': 'http://test.com',
-                    'publishedAt': '2026-01-15T10:00:00Z',
-                    'source': {'name': 'Source'},
-                    'author': 'Author',
-                    'description': 'Desc'
-                }
-            ]
-        }
-        mock_newsapi.return_value = mock_instance
+        mock_newsapi.get_everything.return_value = canned_responses['success_en']
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            results = client.search_news('test')
+        client = NewsAPIClient()
+        results = client.search_news('test')
         
         # Check transformed format
         assert 'title' in results[0]
@@ -205,22 +174,141 @@ class TestNewsAPIClient:
         assert 'description' in results[0]
         assert 'author' in results[0]
     
-    @patch('src.news_api.NewsApiClient')
-    def test_search_news_custom_days_back(self, mock_newsapi):
+    def test_search_news_custom_days_back(self, mock_newsapi, monkeypatch, canned_responses):
         """Test news search with custom days_back parameter."""
-        mock_instance = Mock()
-        mock_instance.get_everything.return_value = {
+        mock_newsapi.get_everything.return_value = canned_responses['empty']
+        
+        # Freeze "now" so the requested date range is deterministic
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2026, 1, 20, 12, 0, 0)
+        
+        monkeypatch.setattr('src.news_api.datetime', FrozenDatetime)
+        
+        client = NewsAPIClient()
+        client.search_news('test', language='en', days_back=7)
+        
+        # Verify the date range is set correctly
+        mock_newsapi.get_everything.assert_called_once()
+        call_kwargs = mock_newsapi.get_everything.call_args[1]
+        assert call_kwargs['from_param'] == '2026-01-13'
+        assert call_kwargs['to'] == '2026-01-20'
+    
+    def test_search_news_single_page_skips_thread_pool(self, mock_newsapi, canned_responses, monkeypatch):
+        """Test that a one-page search is fetched directly, without starting threads."""
+        mock_newsapi.get_everything.return_value = canned_responses['success_en']
+        executor = Mock()
+        monkeypatch.setattr('src.news_api.ThreadPoolExecutor', executor)
+        
+        client = NewsAPIClient()
+        results = client.search_news('test')
+        
+        assert len(results) == 2
+        executor.assert_not_called()
+    
+    def test_search_news_invalid_page_size(self, mock_newsapi):
+        """Test that a zero page size is reported as an error instead of raising."""
+        client = NewsAPIClient()
+        assert client.search_news('test', page_size=0) == []
+    
+    def test_search_news_multiple_pages(self, mock_newsapi):
+        """Test that extra pages are fetched and merged in page order."""
+        def get_everything(page, **kwargs):
+            return {
+                'status': 'ok',
+                'articles': [
+                    {'title': f'Page {page} Article {i}', 'source': {'name': 'Source'}}
+                    for i in range(2)
+                ]
+            }
+        
+        mock_newsapi.get_everything.side_effect = get_everything
+        
+        client = NewsAPIClient()
+        results = client.search_news('test', page_size=2, max_results=6)
+        
+        assert mock_newsapi.get_everything.call_count == 3
+        assert [r['title'] for r in results] == [
+            'Page 1 Article 0', 'Page 1 Article 1',
+            'Page 2 Article 0', 'Page 2 Article 1',
+            'Page 3 Article 0', 'Page 3 Article 1'
+        ]
+    
+    def test_search_news_later_page_error_keeps_first_page(self, mock_newsapi):
+        """Test that a failing later page does not discard earlier results."""
+        def get_everything(page, **kwargs):
+            if page > 1:
+                raise Exception('maximumResultsReached')
+            return {'status': 'ok', 'articles': [{'title': 'First', 'source': {'name': 'S'}}]}
+        
+        mock_newsapi.get_everything.side_effect = get_everything
+        
+        client = NewsAPIClient()
+        results = client.search_news('test', max_results=200)
+        
+        assert [r['title'] for r in results] == ['First']
+    
+    def test_search_news_later_page_error_is_not_cached(self, mock_newsapi):
+        """Test that a search with a transiently failing later page is retried next time."""
+        def get_everything(page, **kwargs):
+            if page > 1:
+                raise Exception('Connection reset')
+            return {'status': 'ok', 'articles': [{'title': 'First', 'source': {'name': 'S'}}]}
+        
+        mock_newsapi.get_everything.side_effect = get_everything
+        
+        client = NewsAPIClient()
+        client.search_news('test', max_results=200)
+        client.search_news('test', max_results=200)
+        
+        assert mock_newsapi.get_everything.call_count == 4
+    
+    def test_search_news_result_limit_is_cached(self, mock_newsapi):
+        """Test that hitting the plan's result limit still counts as a complete search."""
+        def get_everything(page, **kwargs):
+            if page > 1:
+                raise NewsAPIException({
+                    'status': 'error',
+                    'code': 'maximumResultsReached',
+                    'message': 'You have requested too many results.'
+                })
+            return {'status': 'ok', 'articles': [{'title': 'First', 'source': {'name': 'S'}}]}
+        
+        mock_newsapi.get_everything.side_effect = get_everything
+        
+        client = NewsAPIClient()
+        client.search_news('test', max_results=200)
+        results = client.search_news('test', max_results=200)
+        
+        assert [r['title'] for r in results] == ['First']
+        assert mock_newsapi.get_everything.call_count == 2
+    
+    def test_search_news_repeated_query_uses_cache(self, mock_newsapi):
+        """Test that repeating a search on the same day does not call the API again."""
+        mock_newsapi.get_everything.return_value = {
             'status': 'ok',
-            'articles': []
+            'articles': [{'title': 'Cached', 'source': {'name': 'Source'}}]
         }
-        mock_newsapi.return_value = mock_instance
         
-        with patch.dict(os.environ, {'NEWSAPI_KEY': 'test_key'}):
-            client = NewsAPIClient()
-            client.search_news('test', language='en', days_back=7)
+        client = NewsAPIClient()
+        first = client.search_news('Climate', language='en')
+        first[0]['title'] = 'Mutated by caller'
+        second = client.search_news('climate ', language='en')
+        client.search_news('climate', language='de')
         
-        # Verify the date range is set correctly
-        mock_instance.get_everything.assert_called_once()
-        call_kwargs = mock_instance.get_everything.call_args[1]
-        assert 'from_param' in call_kwargs
-        assert 'to' in call_kwargs
+        assert second[0]['title'] == 'Cached'
+        assert mock_newsapi.get_everything.call_count == 2
+    
+    def test_search_news_errors_are_not_cached(self, mock_newsapi):
+        """Test that a failed search is retried instead of served from cache."""
+        mock_newsapi.get_everything.side_effect = [
+            Exception('API Error'),
+            {'status': 'ok', 'articles': [{'title': 'Recovered', 'source': {'name': 'S'}}]}
+        ]
+        
+        client = NewsAPIClient()
+        assert client.search_news('test') == []
+        results = client.search_news('test')
+        
+        assert results[0]['title'] == 'Recovered'
@@ -2,41 +2,92 @@
 Unit tests for summarizer module.
 """
 import pytest
+import sys
+import threading
+import time
+from types import MappingProxyType
+from unittest.mock import Mock
+from src.i18n import t
 from src.summarizer import Summarizer
 
 
+# Read-only sample data shared by every test in this module
+SAMPLE_ARTICLES = (
+    MappingProxyType({'title': 'Tech companies announce new AI products'}),
+    MappingProxyType({'title': 'Stock market reaches new highs amid economic growth'}),
+    MappingProxyType({'title': 'Climate change summit brings world leaders together'})
+)
+
+
 class TestSummarizer:
     """Test cases for Summarizer class."""
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.summarizer = Summarizer()
-        self.sample_articles = [
-            {'title': 'Tech companies announce new AI products'},
-            {'title': 'Stock market reaches new highs amid economic growth'},
-            {'title': 'Climate change summit brings world leaders together'}
-        ]
+        self.sample_articles = SAMPLE_ARTICLES
     
-    def test_summarize_headlines_basic(self):
+    def test_summarize_headlines_basic(self, summarizer):
         """Test basic headline summarization."""
-        summary = self.summarizer.summarize_headlines(self.sample_articles)
+        summary = summarizer.summarize_headlines(self.sample_articles)
         
         assert summary is not None
         assert isinstance(summary, str)
         assert len(summary) > 0
     
-    def test_summarize_empty_articles(self):
+    def test_summarize_empty_articles(self, summarizer):
         """Test summarization with empty articles list."""
-        summary = self.summarizer.summarize_headlines([])
+        summary = summarizer.summarize_headlines([])
         assert summary == "No articles to summarize."
     
-    def test_summarize_no_titles(self):
+    def test_summarize_no_titles(self, summarizer):
         """Test summarization with articles without titles."""
         articles = [{'url': 'https://example.com'}]
-        summary = self.summarizer.summarize_headlines(articles)
+        summary = summarizer.summarize_headlines(articles)
         assert 'No valid headlines' in summary or 'Combined Headlines' in summary
     
-    def test_fallback_summary(self):
+    def test_few_headlines_skip_model(self, summarizer, monkeypatch):
+        """Test that a handful of headlines uses the fallback without loading the model."""
+        load = Mock()
+        monkeypatch.setattr(summarizer, '_initialize_pipeline', load)
+        articles = [
+            {'title': f'Headline number {i} with enough words to pass the short text check'}
+            for i in range(5)
+        ]
+        
+        summary = summarizer.summarize_headlines(articles)
+        
+        load.assert_not_called()
+        assert 'Headline number 0' in summary
+    
+    def test_prepare_loads_model_only_when_needed(self, summarizer, monkeypatch):
+        """Test that prepare() loads the model exactly when summarizing would use it."""
+        load = Mock()
+        monkeypatch.setattr(summarizer, '_initialize_pipeline', load)
+        few = [{'title': f'Headline number {i} with enough words to pass the short text check'} for i in range(5)]
+        many = [{'title': f'Headline number {i} with enough words to pass the short text check'} for i in range(8)]
+        
+        summarizer.prepare(few)
+        load.assert_not_called()
+        
+        summarizer.prepare(many)
+        load.assert_called_once_with()
+    
+    def test_build_model_input_stops_at_headline_boundary(self, summarizer):
+        """Test that model input is cut between headlines, not mid-headline."""
+        headlines = ['a' * 10, 'b' * 10, 'c' * 10]
+        
+        combined = summarizer._build_model_input(headlines, max_input_length=25)
+        
+        assert combined == 'a' * 10 + '. ' + 'b' * 10 + '.'
+        assert len(combined) <= 25
+    
+    def test_build_model_input_truncates_single_long_headline(self, summarizer):
+        """Test that a headline longer than the limit is hard-truncated."""
+        combined = summarizer._build_model_input(['x' * 50], max_input_length=20)
+        
+        assert combined == 'x' * 19 + '.'
+    
+    def test_fallback_summary(self, summarizer):
         """Test fallback summary method."""
         headlines = [
             'First headline about technology',
@@ -44,8 +95,140 @@ class TestSummarizer:
             'Third headline about sports'
         ]
         
-        summary = self.summarizer._fallback_summary(headlines)
+        summary = summarizer._fallback_summary(headlines)
         
         assert 'First headline' in summary
         assert 'Second headline' in summary
         assert 'Third headline' in summary
+    
+    def test_quantize_model_reports_failure(self, monkeypatch):
+        """Test that a failed quantization is reported instead of silently ignored."""
+        fake_torch = Mock()
+        fake_torch.ao.quantization.quantize_dynamic.side_effect = RuntimeError('unsupported')
+        monkeypatch.setitem(sys.modules, 'torch', fake_torch)
+        
+        assert Summarizer._quantize_model(Mock()) is False
+    
+    def test_quantize_model_in_place(self, monkeypatch):
+        """Test that quantization does not copy the FP32 model first."""
+        pipe = Mock()
+        fake_torch = Mock()
+        monkeypatch.setitem(sys.modules, 'torch', fake_torch)
+        
+        assert Summarizer._quantize_model(pipe) is True
+        
+        quantize_dynamic = fake_torch.ao.quantization.quantize_dynamic
+        assert quantize_dynamic.call_args[1]['inplace'] is True
+        assert pipe.model is quantize_dynamic.return_value
+    
+    def test_failed_quantization_reloads_fp32_model(self, monkeypatch):
+        """Test that a possibly half-converted model is replaced by a fresh one."""
+        summarizer = Summarizer()
+        fake_transformers = Mock()
+        fake_transformers.pipeline.side_effect = [Mock(name='mutated'), Mock(name='fresh')]
+        monkeypatch.setitem(sys.modules, 'transformers', fake_transformers)
+        monkeypatch.setattr(Summarizer, '_model_is_cached', staticmethod(lambda: True))
+        monkeypatch.setattr(summarizer, '_quantize_model', lambda pipe: False)
+        
+        summarizer._initialize_pipeline(verbose=False)
+        
+        assert fake_transformers.pipeline.call_count == 2
+        assert summarizer.pipeline._mock_name == 'fresh'
+    
+    def test_search_waits_for_quantization_to_finish(self, monkeypatch):
+        """Test that a search never sees the pipeline while warm-up is still quantizing it."""
+        summarizer = Summarizer()
+        fake_transformers = Mock()
+        monkeypatch.setitem(sys.modules, 'transformers', fake_transformers)
+        monkeypatch.setattr(Summarizer, '_model_is_cached', staticmethod(lambda: True))
+        started, release = threading.Event(), threading.Event()
+        
+        def blocked_quantize(pipe):
+            started.set()
+            release.wait(5)
+            return True
+        
+        monkeypatch.setattr(summarizer, '_quantize_model', blocked_quantize)
+        warm_up = threading.Thread(target=summarizer.warm_up)
+        warm_up.start()
+        assert started.wait(5)
+        
+        search = threading.Thread(target=summarizer._initialize_pipeline)
+        search.start()
+        search.join(0.2)
+        
+        # The search is still waiting and the half-built pipeline isn't visible
+        assert search.is_alive()
+        assert summarizer.pipeline is None
+        
+        release.set()
+        warm_up.join()
+        search.join()
+        
+        fake_transformers.pipeline.assert_called_once()
+        assert summarizer.pipeline is fake_transformers.pipeline.return_value
+    
+    def test_warm_up_loads_model_once_and_quietly(self, monkeypatch, capsys):
+        """Test that warm-up and a concurrent search share a single model load."""
+        summarizer = Summarizer()
+        fake_transformers = Mock()
+        monkeypatch.setitem(sys.modules, 'transformers', fake_transformers)
+        monkeypatch.setattr(Summarizer, '_model_is_cached', staticmethod(lambda: True))
+        monkeypatch.setattr(summarizer, '_quantize_model', lambda pipe: True)
+        
+        threads = [threading.Thread(target=summarizer.warm_up) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        summarizer._initialize_pipeline()
+        
+        fake_transformers.pipeline.assert_called_once()
+        assert summarizer.pipeline is fake_transformers.pipeline.return_value
+        assert capsys.readouterr().out == ''
+    
+    def test_warm_up_skips_uncached_model(self, monkeypatch, capsys):
+        """Test that warm-up leaves downloading the model to the first search."""
+        summarizer = Summarizer()
+        fake_transformers = Mock()
+        monkeypatch.setitem(sys.modules, 'transformers', fake_transformers)
+        monkeypatch.setattr(Summarizer, '_model_is_cached', staticmethod(lambda: False))
+        monkeypatch.setattr(summarizer, '_quantize_model', lambda pipe: True)
+        
+        summarizer.warm_up()
+        assert summarizer.pipeline is None
+        fake_transformers.pipeline.assert_not_called()
+        
+        summarizer._initialize_pipeline()
+        
+        fake_transformers.pipeline.assert_called_once()
+        # Loader options are left to transformers; newer versions reject duplicates
+        assert 'model_kwargs' not in fake_transformers.pipeline.call_args[1]
+        assert summarizer.pipeline is fake_transformers.pipeline.return_value
+    
+    def test_search_announces_loading_while_warm_up_runs(self, monkeypatch, capsys):
+        """Test that a search waiting on a running warm-up prints the loading message first."""
+        summarizer = Summarizer()
+        load = Mock()
+        monkeypatch.setattr(summarizer, '_load_pipeline', load)
+        
+        # Simulate a warm-up in progress by holding the lock
+        summarizer._pipeline_lock.acquire()
+        search = threading.Thread(target=summarizer._initialize_pipeline)
+        search.start()
+        output = ''
+        for _ in range(200):
+            output += capsys.readouterr().out
+            if output:
+                break
+            time.sleep(0.01)
+        
+        assert output.strip() == t('summarizer.loading')
+        
+        # Warm-up finishes
+        summarizer.pipeline = Mock()
+        summarizer._pipeline_lock.release()
+        search.join()
+        
+        load.assert_not_called()
+        assert capsys.readouterr().out.strip() == t('summarizer.loaded')